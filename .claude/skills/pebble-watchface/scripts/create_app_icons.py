@@ -3,9 +3,15 @@
 Create app icons from screenshot_basalt.png
 
 Usage:
-    python3 create_app_icons.py [project_dir]
+    python3 create_app_icons.py [project_dir] [--force]
 
-If project_dir is not specified, uses current directory.
+Options:
+    project_dir     Project directory (default: current directory)
+    --force         Rebuild icons even if they are newer than the screenshot
+
+Icons that are newer than screenshot_basalt.png are left as they are, so a
+screenshot copied in with its older mtime preserved (cp -p, rsync -t, tar
+extraction) needs --force.
 
 Creates:
     - icon_80x80.png (small app icon)
@@ -14,16 +20,24 @@ Creates:
 
 import sys
 import os
+import argparse
 from pathlib import Path
 
 try:
+    import PIL
     from PIL import Image
 except ImportError:
     print("Error: Pillow is required. Install with: pip3 install Pillow")
     sys.exit(1)
 
+# Pillow-SIMD releases carry a ".postN" version suffix
+PILLOW_SIMD = "post" in PIL.__version__
+
+# Small and large app icon sizes (square, in pixels)
+ICON_SIZES = (80, 144)
+
 
-def create_app_icons(project_dir: str = "."):
+def create_app_icons(project_dir: str = ".", force: bool = False):
     """Create 80x80 and 144x144 app icons from screenshot_basalt.png"""
 
     project_path = Path(project_dir)
@@ -34,24 +48,55 @@ def create_app_icons(project_dir: str = "."):
         print("Run 'pebble screenshot --emulator basalt screenshot_basalt.png' first")
         sys.exit(1)
 
-    # Load the screenshot
-    img = Image.open(screenshot_path)
+    # Unless forced, only rebuild icons that are missing or older than the
+    # screenshot
+    source_mtime = screenshot_path.stat().st_mtime_ns
+    icon_paths = {size: project_path / f"icon_{size}x{size}.png" for size in ICON_SIZES}
+    stale_sizes = [
+        size for size, icon_path in icon_paths.items()
+        if force or not icon_path.exists() or icon_path.stat().st_mtime_ns < source_mtime
+    ]
+
+    if not stale_sizes:
+        print("App icons are newer than the screenshot, skipping (use --force to rebuild)")
+        return
+
+    print(f"Using {'Pillow-SIMD' if PILLOW_SIMD else 'Pillow'} {PIL.__version__}")
 
-    # Create 80x80 icon
-    icon_80 = img.resize((80, 80), Image.Resampling.LANCZOS)
-    icon_80_path = project_path / "icon_80x80.png"
-    icon_80.save(icon_80_path)
-    print(f"Created: {icon_80_path}")
+    # Decode the screenshot and convert it once; both icons resize from this
+    with Image.open(screenshot_path) as im:
+        im.load()
+        img = im.convert("RGBA")
 
-    # Create 144x144 icon
-    icon_144 = img.resize((144, 144), Image.Resampling.LANCZOS)
-    icon_144_path = project_path / "icon_144x144.png"
-    icon_144.save(icon_144_path)
-    print(f"Created: {icon_144_path}")
+    # Box-reduce large screenshots by an integer factor first, so the bicubic
+    # pass only convolves over a near-target-sized image. The factor is based
+    # on the largest icon so both sizes share the reduced image.
+    factor = max(1, min(img.size) // max(ICON_SIZES))
+    if factor > 1:
+        img = img.reduce(factor)
+
+    for size in stale_sizes:
+        if img.size == (size, size):
+            # Already the right size (e.g. a pre-cropped screenshot)
+            icon = img
+        else:
+            # Bicubic is indistinguishable from LANCZOS at icon sizes and cheaper
+            icon = img.resize((size, size), Image.Resampling.BICUBIC, reducing_gap=None)
+        icon.save(icon_paths[size], optimize=False, compress_level=1)
+        print(f"Created: {icon_paths[size]}")
 
     print("\nApp icons created successfully!")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Create app icons from screenshot_basalt.png")
+    parser.add_argument("project_dir", nargs="?", default=".", help="Project directory")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild icons even if they are newer than the screenshot")
+
+    args = parser.parse_args()
+    create_app_icons(args.project_dir, args.force)
+
+
 if __name__ == "__main__":
-    project_dir = sys.argv[1] if len(sys.argv) > 1 else "."
-    create_app_icons(project_dir)
+    main()
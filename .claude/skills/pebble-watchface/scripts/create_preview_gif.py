@@ -3,111 +3,242 @@
 Create animated GIF previews for each platform by capturing multiple frames.
 
 Usage:
-    python3 create_preview_gif.py [project_dir] [--frames N] [--delay MS]
+    python3 create_preview_gif.py [project_dir] [--frames N] [--delay MS] [--backend B]
 
 Options:
     project_dir     Project directory (default: current directory)
     --frames N      Number of frames to capture (default: 10)
     --delay MS      Delay between frames in milliseconds (default: 500)
+    --backend B     GIF encoder: pillow or ffmpeg (default: pillow). ffmpeg is
+                    much faster for long captures; falls back to pillow if
+                    ffmpeg is not installed
 
 Creates:
     - preview_basalt.gif
     - preview_aplite.gif
     - preview_chalk.gif
 
-Requires: Pillow, pebble SDK installed
+Requires: Pillow (or Pillow-SIMD, see requirements-simd.txt), pebble SDK installed
 """
 
 import sys
 import os
+import shutil
 import subprocess
+import tempfile
 import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
 from pathlib import Path
 
 try:
+    import PIL
     from PIL import Image
 except ImportError:
     print("Error: Pillow is required. Install with: pip3 install Pillow")
     sys.exit(1)
 
+# Pillow-SIMD releases carry a ".postN" version suffix
+PILLOW_SIMD = "post" in PIL.__version__
 
-def capture_frames(emulator: str, project_dir: Path, num_frames: int, frame_delay_ms: int) -> list:
-    """Capture multiple frames from an emulator"""
+# Maximum palette size of a GIF
+GIF_COLORS = 256
+
+# Platforms are processed concurrently; keep their output lines intact
+_print_lock = threading.Lock()
+
+
+def log(*args, **kwargs):
+    """Thread-safe print"""
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+def make_temp_dir() -> Path:
+    """Create a temp directory for frames, on tmpfs (/dev/shm) when available"""
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return Path(tempfile.mkdtemp(prefix="pebble_frames_", dir=shm))
+    return Path(tempfile.mkdtemp(prefix="pebble_frames_"))
+
+
+def capture_frames(emulator: str, frames_dir: Path, num_frames: int, frame_delay_ms: int) -> list:
+    """Capture multiple frames from an emulator into frames_dir
+
+    Returns the paths of the captured frames. Frames are only decoded when
+    the GIF is encoded, so frames_dir must outlive the encode.
+    """
     frames = []
-    temp_dir = project_dir / "temp_frames"
-    temp_dir.mkdir(exist_ok=True)
 
-    print(f"Capturing {num_frames} frames from {emulator}...")
+    log(f"[{emulator}] Capturing {num_frames} frames...")
+
+    # Pace frames against a monotonic deadline so the time spent capturing
+    # counts towards the delay instead of being added on top of it
+    next_deadline = time.monotonic()
 
     for i in range(num_frames):
-        frame_path = temp_dir / f"frame_{emulator}_{i:03d}.png"
+        # Number files by captured frame so the sequence has no gaps
+        frame_path = frames_dir / f"frame_{emulator}_{len(frames):03d}.png"
 
         # Capture screenshot
         result = subprocess.run(
             ["pebble", "screenshot", "--emulator", emulator, str(frame_path)],
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
         )
 
         if result.returncode != 0:
-            print(f"Warning: Failed to capture frame {i} for {emulator}")
+            log(f"[{emulator}] Warning: Failed to capture frame {i}")
             continue
 
         if frame_path.exists():
-            frames.append(Image.open(frame_path).copy())
-
-        # Wait between frames
-        time.sleep(frame_delay_ms / 1000.0)
+            frames.append(frame_path)
 
         # Progress indicator
-        print(f"  Frame {i+1}/{num_frames}", end="\r")
+        log(f"[{emulator}]   Frame {i+1}/{num_frames}")
 
-    print(f"  Captured {len(frames)} frames for {emulator}")
+        # Wait out the rest of the frame interval, if any is left
+        next_deadline += frame_delay_ms / 1000.0
+        remaining = next_deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            next_deadline = time.monotonic()
 
-    # Cleanup temp files
-    for f in temp_dir.glob(f"frame_{emulator}_*.png"):
-        f.unlink()
-
-    try:
-        temp_dir.rmdir()
-    except OSError:
-        pass  # Directory not empty, other platform frames may exist
+    log(f"[{emulator}] Captured {len(frames)} frames")
 
     return frames
 
 
-def create_gif(frames: list, output_path: Path, frame_duration_ms: int = 200):
-    """Create animated GIF from frames"""
+def build_palette(frames):
+    """Build one exact GIF palette covering the colors of every frame
+
+    Frames are only read. Pebble screenshots usually use few colors, so the
+    union of their colors fits in a GIF palette and every frame maps onto it
+    losslessly. Returns None when the frames use more than GIF_COLORS colors
+    between them (common on chalk), as no shared palette is exact then.
+    """
+    colors = set()
+    for frame in frames:
+        rgb = frame if frame.mode == "RGB" else frame.convert("RGB")
+        # getcolors() returns None as soon as it finds too many colors
+        found = rgb.getcolors(GIF_COLORS)
+        if found is None:
+            return None
+        colors.update(color for _, color in found)
+        if len(colors) > GIF_COLORS:
+            return None
+
+    palette = Image.new("P", (1, 1))
+    palette.putpalette([channel for color in colors for channel in color])
+    return palette
+
+
+def create_gif(frames, output_path: Path, frame_duration_ms: int = 200):
+    """Create animated GIF from an iterable of frames
+
+    Frames are decoded once, while the shared palette is built, and kept
+    decoded until they are quantized; each is closed right after that. A
+    Pebble screenshot is at most 180x180, so holding a capture's worth of
+    frames is cheap compared with decoding every PNG a second time. Pillow's
+    GIF writer also keeps every quantized (palette mode) frame until the
+    file is written, so peak memory grows with the number of frames.
+    """
+    frames = list(frames)
     if not frames:
-        print(f"No frames to create GIF: {output_path}")
+        log(f"No frames to create GIF: {output_path}")
         return False
 
+    palette = build_palette(frames)
+
+    # Screenshots are a fixed size per platform, so convert every frame into
+    # one reusable RGB buffer instead of allocating a converted copy per frame
+    rgb = Image.new("RGB", frames[0].size)
+
+    def to_rgb(frame):
+        if frame.size != rgb.size:
+            return frame.convert("RGB")
+        rgb.paste(frame)
+        return rgb
+
+    def quantize(frame):
+        if palette is not None:
+            # Exact shared palette: lossless, and one palette for all frames
+            quantized = to_rgb(frame).quantize(palette=palette, dither=Image.Dither.NONE)
+        else:
+            # Too many colors to share exactly; give each frame its own
+            # adaptive palette, as the GIF writer would by default
+            quantized = to_rgb(frame).convert("P", palette=Image.Palette.ADAPTIVE, colors=GIF_COLORS)
+        frame.close()  # Release the source frame's decoded pixels
+        return quantized
+
     # Save as animated GIF
-    frames[0].save(
+    quantize(frames[0]).save(
         output_path,
         save_all=True,
-        append_images=frames[1:],
+        append_images=(quantize(frame) for frame in frames[1:]),
         duration=frame_duration_ms,
-        loop=0  # Loop forever
+        loop=0,  # Loop forever
+        optimize=True,
+        disposal=2
     )
-    print(f"Created: {output_path}")
+    log(f"Created: {output_path}")
     return True
 
 
-def create_preview_gifs(project_dir: str = ".", num_frames: int = 10, frame_delay_ms: int = 500):
+def create_gif_from_files(frame_paths: list, output_path: Path, frame_duration_ms: int = 200):
+    """Create animated GIF from frame files
+
+    Top-level so it can run in a worker process.
+    """
+    return create_gif((Image.open(path) for path in frame_paths), output_path, frame_duration_ms)
+
+
+def create_gif_ffmpeg(emulator: str, frames_dir: Path, output_path: Path, frame_duration_ms: int = 200):
+    """Create animated GIF from the frames captured in frames_dir using ffmpeg"""
+    result = subprocess.run(
+        [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-framerate", f"{1000 / frame_duration_ms:g}",
+            "-i", str(frames_dir / f"frame_{emulator}_%03d.png"),
+            "-vf", f"split[a][b];[a]palettegen=max_colors={GIF_COLORS}[p];[b][p]paletteuse",
+            "-loop", "0",
+            str(output_path)
+        ],
+        capture_output=True,
+        text=True
+    )
+
+    if result.returncode != 0:
+        log(f"Warning: ffmpeg failed to create {output_path}: {result.stderr.strip()}")
+        return False
+
+    log(f"Created: {output_path}")
+    return True
+
+
+def create_preview_gifs(project_dir: str = ".", num_frames: int = 10, frame_delay_ms: int = 500,
+                        backend: str = "pillow"):
     """Create animated GIF previews for all platforms"""
 
     project_path = Path(project_dir)
     platforms = ["basalt", "aplite", "chalk"]
 
+    if backend == "ffmpeg" and shutil.which("ffmpeg") is None:
+        print("Warning: ffmpeg not found, falling back to the pillow backend")
+        backend = "pillow"
+
     print(f"Creating preview GIFs with {num_frames} frames each...")
     print(f"Frame capture delay: {frame_delay_ms}ms")
+    print(f"GIF backend: {backend}")
+    print(f"Using {'Pillow-SIMD' if PILLOW_SIMD else 'Pillow'} {PIL.__version__}")
     print()
 
-    for platform in platforms:
-        print(f"\n--- {platform.upper()} ---")
+    frames_dirs = []
 
+    def capture_platform(platform):
         # Check if emulator is running by trying to capture
         test_result = subprocess.run(
             ["pebble", "screenshot", "--emulator", platform, "/dev/null"],
@@ -116,17 +247,51 @@ def create_preview_gifs(project_dir: str = ".", num_frames: int = 10, frame_dela
         )
 
         if test_result.returncode != 0:
-            print(f"Skipping {platform} - emulator not running")
-            print(f"Start with: pebble install --emulator {platform}")
-            continue
+            log(f"[{platform}] Skipping - emulator not running\n"
+                f"[{platform}] Start with: pebble install --emulator {platform}")
+            return None
+
+        frames_dir = make_temp_dir()
+        frames_dirs.append(frames_dir)
 
         # Capture frames
-        frames = capture_frames(platform, project_path, num_frames, frame_delay_ms)
+        frame_paths = capture_frames(platform, frames_dir, num_frames, frame_delay_ms)
+        return platform, frames_dir, frame_paths
 
-        if frames:
-            # Create GIF
-            gif_path = project_path / f"preview_{platform}.gif"
-            create_gif(frames, gif_path, frame_duration_ms=200)
+    try:
+        # Each emulator is a separate process and capturing is mostly waiting
+        # on subprocesses and sleeps, so threads are enough to run them side
+        # by side
+        with ThreadPoolExecutor(max_workers=len(platforms)) as executor:
+            captures = [c for c in executor.map(capture_platform, platforms) if c and c[2]]
+
+        # Create GIFs
+        if backend == "ffmpeg" and captures:
+            # ffmpeg does the encoding in its own process
+            with ThreadPoolExecutor(max_workers=len(captures)) as executor:
+                futures = [
+                    executor.submit(create_gif_ffmpeg, platform, frames_dir,
+                                    project_path / f"preview_{platform}.gif", 200)
+                    for platform, frames_dir, _ in captures
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            jobs = [
+                (frame_paths, project_path / f"preview_{platform}.gif", 200)
+                for platform, _, frame_paths in captures
+            ]
+            # Quantizing and LZW encoding hold the GIL, so use processes to
+            # encode the platforms in parallel
+            if len(jobs) > 1:
+                with Pool(min(len(jobs), os.cpu_count() or 1)) as pool:
+                    pool.starmap(create_gif_from_files, jobs)
+            else:
+                for job in jobs:
+                    create_gif_from_files(*job)
+    finally:
+        for frames_dir in frames_dirs:
+            shutil.rmtree(frames_dir, ignore_errors=True)
 
     print("\nDone!")
 
@@ -136,9 +301,11 @@ def main():
     parser.add_argument("project_dir", nargs="?", default=".", help="Project directory")
     parser.add_argument("--frames", type=int, default=10, help="Number of frames to capture")
     parser.add_argument("--delay", type=int, default=500, help="Delay between frames (ms)")
+    parser.add_argument("--backend", choices=["pillow", "ffmpeg"], default="pillow",
+                        help="GIF encoder (ffmpeg is faster for many frames)")
 
     args = parser.parse_args()
-    create_preview_gifs(args.project_dir, args.frames, args.delay)
+    create_preview_gifs(args.project_dir, args.frames, args.delay, args.backend)
 
 
 if __name__ == "__main__":
@@ -18,12 +18,22 @@ Options:
 
 import os
 import sys
+import json
 import argparse
-import uuid
+from uuid import uuid4
 import shutil
 from pathlib import Path
 
 
+# Template files shipped with the skill, resolved once
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / 'templates'
+TEMPLATES = {
+    'animated': TEMPLATES_DIR / 'animated-watchface.c',
+    'static': TEMPLATES_DIR / 'static-watchface.c',
+    'rockyjs': TEMPLATES_DIR / 'rocky-watchface.js'
+}
+
+
 def slugify(name):
     """Convert name to a valid slug"""
     return name.lower().replace(' ', '-').replace('_', '-')
@@ -31,7 +41,7 @@ def slugify(name):
 
 def generate_uuid():
     """Generate a random UUID for the watchface"""
-    return str(uuid.uuid4())
+    return f"{uuid4()}"
 
 
 def create_package_json(project_path, name, display_name, author):
@@ -58,9 +68,7 @@ def create_package_json(project_path, name, display_name, author):
         }
     }
 
-    import json
-    with open(project_path / 'package.json', 'w') as f:
-        json.dump(content, f, indent=2)
+    (project_path / 'package.json').write_text(json.dumps(content, indent=2))
 
     print(f"  Created package.json")
 
@@ -107,8 +115,7 @@ def build(ctx):
         js=ctx.path.ant_glob(['src/js/**/*.js', 'src/js/**/*.json', 'src/common/**/*.js', 'src/common/**/*.json'])
     )
 """
-    with open(project_path / 'wscript', 'w') as f:
-        f.write(content)
+    (project_path / 'wscript').write_text(content)
 
     print(f"  Created wscript")
 
@@ -132,48 +139,39 @@ Thumbs.db
 # Pebble SDK
 .pebble-sdk/
 """
-    with open(project_path / '.gitignore', 'w') as f:
-        f.write(content)
+    (project_path / '.gitignore').write_text(content)
 
     print(f"  Created .gitignore")
 
 
-def copy_template(project_path, template_type, skill_path):
+def copy_template(project_path, template_type):
     """Copy the appropriate template file"""
-    templates = {
-        'animated': 'animated-watchface.c',
-        'static': 'static-watchface.c',
-        'rockyjs': 'rocky-watchface.js'
-    }
-
-    template_file = templates.get(template_type, 'animated-watchface.c')
-    template_path = skill_path / 'templates' / template_file
+    template_path = TEMPLATES.get(template_type, TEMPLATES['animated'])
+    template_file = template_path.name
 
     if template_type == 'rockyjs':
         # JavaScript project structure
         js_dir = project_path / 'src' / 'pkjs'
         js_dir.mkdir(parents=True, exist_ok=True)
 
-        if template_path.exists():
-            shutil.copy(template_path, js_dir / 'index.js')
+        try:
+            shutil.copyfile(template_path, js_dir / 'index.js')
             print(f"  Created src/pkjs/index.js from {template_file}")
-        else:
+        except FileNotFoundError:
             # Create minimal JS file
-            with open(js_dir / 'index.js', 'w') as f:
-                f.write("// Rocky.js watchface\nvar rocky = require('rocky');\n")
+            (js_dir / 'index.js').write_text("// Rocky.js watchface\nvar rocky = require('rocky');\n")
             print(f"  Created src/pkjs/index.js (minimal)")
     else:
         # C project structure
         c_dir = project_path / 'src' / 'c'
         c_dir.mkdir(parents=True, exist_ok=True)
 
-        if template_path.exists():
-            shutil.copy(template_path, c_dir / 'main.c')
+        try:
+            shutil.copyfile(template_path, c_dir / 'main.c')
             print(f"  Created src/c/main.c from {template_file}")
-        else:
+        except FileNotFoundError:
             # Create minimal C file
-            with open(c_dir / 'main.c', 'w') as f:
-                f.write('#include <pebble.h>\n\nint main(void) {\n    app_event_loop();\n    return 0;\n}\n')
+            (c_dir / 'main.c').write_text('#include <pebble.h>\n\nint main(void) {\n    app_event_loop();\n    return 0;\n}\n')
             print(f"  Created src/c/main.c (minimal)")
 
 
@@ -216,15 +214,11 @@ def main():
     (project_path / 'resources' / 'fonts').mkdir(parents=True)
     (project_path / 'resources' / 'images').mkdir(parents=True)
 
-    # Find skill path (for templates)
-    script_path = Path(__file__).resolve().parent
-    skill_path = script_path.parent
-
     # Create files
     create_package_json(project_path, args.name, display_name, args.author)
     create_wscript(project_path)
     create_gitignore(project_path)
-    copy_template(project_path, template_type, skill_path)
+    copy_template(project_path, template_type)
 
     print(f"\n✓ Project created successfully!")
     print(f"\nNext steps:")
@@ -6,10 +6,10 @@ Usage:
     python generate_uuid.py
 """
 
-import uuid
+from uuid import uuid4
 
 def main():
-    new_uuid = str(uuid.uuid4())
+    new_uuid = f"{uuid4()}"
     print(f"Generated UUID: {new_uuid}")
     print(f"\nUse in package.json:")
     print(f'  "uuid": "{new_uuid}"')
@@ -16,10 +16,21 @@ Exit codes:
 import os
 import sys
 import json
+import mmap
 import re
+from functools import lru_cache
 from pathlib import Path
 
 
+UUID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+                     re.IGNORECASE)
+
+# Tokens validate_c_source looks for, matched in a single pass per file
+C_TOKENS = ('#include <pebble.h>', 'int main', 'float ', 'double ', 'malloc(', 'calloc(',
+            'window_create', 'window_destroy', 'gpath_create', 'gpath_destroy')
+C_TOKEN_RE = re.compile(b'|'.join(re.escape(token.encode()) for token in C_TOKENS))
+
+
 class Colors:
     """ANSI color codes for terminal output"""
     RED = '\033[91m'
@@ -42,6 +53,29 @@ def print_status(status, message):
         print(f"  {Colors.BLUE}ℹ{Colors.RESET} {message}")
 
 
+def collect_files(root):
+    """Walk a directory tree once and group its files by suffix
+
+    Returns a dict mapping suffix (e.g. '.c') to a list of Paths. A missing
+    directory yields an empty dict.
+    """
+    files = {}
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue  # Missing or unreadable; skipped like rglob did
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    suffix = os.path.splitext(entry.name)[1]
+                    files.setdefault(suffix, []).append(Path(entry.path))
+    return files
+
+
 def validate_file_exists(project_path, filename, required=True):
     """Check if a required file exists"""
     file_path = project_path / filename
@@ -54,6 +88,22 @@ def validate_file_exists(project_path, filename, required=True):
         return False
 
 
+@lru_cache(maxsize=64)
+def _load_json_cached(path, mtime_ns, size):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load_json(path):
+    """Load a JSON file, reusing the parsed result while the file is unchanged
+
+    The file is re-read when its mtime or size changes. The returned object
+    is shared between callers and must not be mutated.
+    """
+    st = os.stat(path)
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 def validate_package_json(project_path):
     """Validate package.json structure and contents"""
     package_path = project_path / 'package.json'
@@ -63,8 +113,7 @@ def validate_package_json(project_path):
         return ['package.json not found']
 
     try:
-        with open(package_path, 'r') as f:
-            pkg = json.load(f)
+        pkg = load_json(package_path)
     except json.JSONDecodeError as e:
         return [f'package.json has invalid JSON: {e}']
 
@@ -80,8 +129,7 @@ def validate_package_json(project_path):
 
         if 'uuid' not in pebble:
             errors.append('Missing pebble.uuid')
-        elif not re.match(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-                         pebble.get('uuid', ''), re.IGNORECASE):
+        elif not UUID_RE.match(pebble.get('uuid', '')):
             errors.append('Invalid UUID format')
 
         if 'displayName' not in pebble:
@@ -114,7 +162,7 @@ def validate_package_json(project_path):
     return errors
 
 
-def validate_source_structure(project_path):
+def validate_source_structure(project_path, src_files=None):
     """Validate source file structure"""
     errors = []
 
@@ -123,8 +171,11 @@ def validate_source_structure(project_path):
         errors.append('src/ directory not found')
         return errors
 
+    if src_files is None:
+        src_files = collect_files(src_path)
+
     # Check for C source files
-    c_sources = list((project_path / 'src').rglob('*.c'))
+    c_sources = src_files.get('.c', [])
     if c_sources:
         print_status('ok', f'Found {len(c_sources)} C source file(s)')
 
@@ -136,7 +187,7 @@ def validate_source_structure(project_path):
             print_status('warning', 'No main.c found (uncommon)')
     else:
         # Check for JavaScript sources
-        js_sources = list((project_path / 'src').rglob('*.js'))
+        js_sources = src_files.get('.js', [])
         if js_sources:
             print_status('ok', f'Found {len(js_sources)} JavaScript source file(s)')
         else:
@@ -145,38 +196,60 @@ def validate_source_structure(project_path):
     return errors
 
 
-def validate_c_source(project_path):
+def scan_c_tokens(source_file):
+    """Return the set of C_TOKENS that appear in a source file
+
+    The file is memory-mapped and scanned as raw bytes, so it is never read
+    into a Python string or decoded.
+    """
+    found = set()
+    if os.path.getsize(source_file) == 0:
+        return found  # mmap cannot map an empty file
+
+    with open(source_file, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        for match in C_TOKEN_RE.finditer(content):
+            found.add(match.group().decode())
+            if len(found) == len(C_TOKENS):
+                break
+
+    return found
+
+
+def validate_c_source(project_path, src_files=None):
     """Validate C source code for common issues"""
     warnings = []
 
-    c_sources = list((project_path / 'src').rglob('*.c'))
+    if src_files is None:
+        src_files = collect_files(project_path / 'src')
+
+    c_sources = src_files.get('.c', [])
     for source_file in c_sources:
         try:
-            with open(source_file, 'r') as f:
-                content = f.read()
+            found = scan_c_tokens(source_file)
 
             # Check for pebble.h include
-            if '#include <pebble.h>' not in content:
+            if '#include <pebble.h>' not in found:
                 warnings.append(f'{source_file.name}: Missing #include <pebble.h>')
 
             # Check for main function
-            if 'int main' in content:
+            if 'int main' in found:
                 print_status('ok', f'{source_file.name}: Has main() function')
             elif source_file.name == 'main.c':
                 warnings.append(f'{source_file.name}: No main() function found')
 
             # Check for common issues
-            if 'float ' in content or 'double ' in content:
+            if 'float ' in found or 'double ' in found:
                 print_status('warning', f'{source_file.name}: Uses floating point (not recommended)')
 
-            if 'malloc(' in content or 'calloc(' in content:
+            if 'malloc(' in found or 'calloc(' in found:
                 print_status('info', f'{source_file.name}: Uses dynamic memory allocation')
 
             # Check for proper cleanup patterns
-            if 'window_create' in content and 'window_destroy' not in content:
+            if 'window_create' in found and 'window_destroy' not in found:
                 warnings.append(f'{source_file.name}: window_create without window_destroy')
 
-            if 'gpath_create' in content and 'gpath_destroy' not in content:
+            if 'gpath_create' in found and 'gpath_destroy' not in found:
                 warnings.append(f'{source_file.name}: gpath_create without gpath_destroy')
 
         except Exception as e:
@@ -188,20 +261,23 @@ def validate_c_source(project_path):
     return warnings
 
 
-def validate_resources(project_path):
+def validate_resources(project_path, resource_files=None):
     """Check resources directory"""
     resources_path = project_path / 'resources'
 
     if resources_path.exists():
         print_status('ok', 'resources/ directory exists')
 
+        if resource_files is None:
+            resource_files = collect_files(resources_path)
+
         # Check for fonts
-        font_files = list(resources_path.rglob('*.ttf')) + list(resources_path.rglob('*.otf'))
+        font_files = resource_files.get('.ttf', []) + resource_files.get('.otf', [])
         if font_files:
             print_status('info', f'Found {len(font_files)} custom font(s)')
 
         # Check for images
-        image_files = list(resources_path.rglob('*.png')) + list(resources_path.rglob('*.pbi'))
+        image_files = resource_files.get('.png', []) + resource_files.get('.pbi', [])
         if image_files:
             print_status('info', f'Found {len(image_files)} image resource(s)')
     else:
@@ -228,6 +304,10 @@ def main():
 
     all_errors = []
 
+    # Walk each tree once and share the listings between checks
+    src_files = collect_files(project_path / 'src')
+    resource_files = collect_files(project_path / 'resources')
+
     # File structure checks
     print(f"{Colors.BOLD}Checking file structure...{Colors.RESET}")
     validate_file_exists(project_path, 'package.json', required=True)
@@ -241,16 +321,16 @@ def main():
 
     # Source structure validation
     print(f"\n{Colors.BOLD}Checking source structure...{Colors.RESET}")
-    errors = validate_source_structure(project_path)
+    errors = validate_source_structure(project_path, src_files)
     all_errors.extend(errors)
 
     # C source validation
     print(f"\n{Colors.BOLD}Analyzing C source code...{Colors.RESET}")
-    validate_c_source(project_path)
+    validate_c_source(project_path, src_files)
 
     # Resources check
     print(f"\n{Colors.BOLD}Checking resources...{Colors.RESET}")
-    validate_resources(project_path)
+    validate_resources(project_path, resource_files)
 
     # Summary
     print(f"\n{Colors.BOLD}Summary{Colors.RESET}")